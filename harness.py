@@ -3,19 +3,37 @@
 # MVP prompt-refinement runner for Bedrock (Anthropic Claude) + domain YAMLs
 
 import os
+import math
 import re
 import csv
-import json
+import copy
 import yaml
-import time
+import random
+import asyncio
+import threading
 import argparse
+import textwrap
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable
 
 import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+import orjson
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectionClosedError, ReadTimeoutError
 from dotenv import load_dotenv
 
+try:
+    # libyaml C parser; much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # -----------------------------
 # Config & setup
 # -----------------------------
@@ -32,14 +50,55 @@ MANIFEST_PATH = Path("manifest.yaml")  # optional
 
 # Anthropic Messages API schema for Bedrock
 ANTHROPIC_VERSION = "bedrock-2023-05-31"
+_USER_TEXT_SLOT = "__USER_TEXT__"  # placeholder spliced out of the cached request envelope
+
+# Backoff for ThrottlingException that outlasts botocore's own retries
+THROTTLE_RETRIES = 4
+THROTTLE_BACKOFF_BASE = 2.0   # seconds; doubled per attempt, full jitter
+THROTTLE_BACKOFF_CAP = 60.0
+# AIMD on top of botocore's adaptive mode: at most one decrease per cooldown window,
+# one additive step back up after a streak of successful calls
+THROTTLE_COOLDOWN = 5.0       # seconds
+THROTTLE_RECOVERY_SUCCESSES = 10
+
+# Parsed YAML docs keyed by path -> (mtime, size, doc); LRU-bounded
+YAML_CACHE_SIZE = 100
+_yaml_cache: OrderedDict[str, tuple[float, int, object]] = OrderedDict()
+
+# naive sentence boundary: a run of ., !, ? followed by whitespace or end of text
+_SENTENCE_RE = re.compile(r"[.!?]+(?:\s|$)")
+
+# ASCII fast path: folding terminators to "." and whitespace to " " turns each
+# boundary into exactly one ". " pair, so counting is str.translate + str.count.
+# The table is ASCII-only so translate stays on CPython's ASCII fast path.
+_SENTENCE_FOLD = {ord("!"): ".", ord("?"): "."}
+_SENTENCE_FOLD.update({c: " " for c in range(128) if chr(c).isspace()})
+
+_JSON_BOOL = ("false", "true")  # indexed by bool
 
 
 # -----------------------------
 # Utilities
 # -----------------------------
 def load_yaml(path: Path):
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """
+    Parses a YAML file, reusing the previous parse while its mtime/size are unchanged.
+    Returns a deep copy so callers can mutate the result freely.
+    """
+    st = path.stat()
+    key = str(path)
+    cached = _yaml_cache.get(key)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _yaml_cache.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    # Raw bytes in one read; libyaml decodes UTF-8 itself, skipping the text layer
+    doc = yaml.load(path.read_bytes(), Loader=_Loader)
+    _yaml_cache[key] = (st.st_mtime, st.st_size, doc)
+    _yaml_cache.move_to_end(key)
+    if len(_yaml_cache) > YAML_CACHE_SIZE:
+        _yaml_cache.popitem(last=False)
+    return copy.deepcopy(doc)
 
 
 def read_text(path: Path) -> str:
@@ -58,16 +117,59 @@ def timestamp_dir(base: Path) -> Path:
     return out
 
 
-def bedrock_client(profile: str | None, region: str):
-    if profile:
-        session = boto3.Session(profile_name=profile, region_name=region)
-        return session.client("bedrock-runtime", region_name=region)
-    return boto3.client("bedrock-runtime", region_name=region)
+@lru_cache(maxsize=None)
+def bedrock_session(profile: str | None, region: str) -> boto3.Session:
+    # One session per (profile, region): credentials and endpoint data resolve once
+    return boto3.Session(profile_name=profile, region_name=region)
+
+
+# Runtime clients keyed by (profile, region, max_pool_connections). An explicit dict
+# rather than lru_cache so a stale client can be evicted without dropping the others.
+_clients: dict[tuple[str | None, str, int], object] = {}
+# boto3 sessions are not thread-safe; serialize client construction and eviction
+_CLIENT_LOCK = threading.Lock()
+
+
+def bedrock_client(profile: str | None, region: str, max_pool_connections: int = 10):
+    key = (profile, region, max_pool_connections)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    # Keep-alive pool sized for the run's concurrency so TLS handshakes happen once
+    # per connection; botocore's adaptive mode handles retries and throttling.
+    config = Config(
+        max_pool_connections=max(10, max_pool_connections),
+        connect_timeout=5,
+        read_timeout=60,
+        retries={"mode": "adaptive", "max_attempts": 3},
+        tcp_keepalive=True,
+    )
+    with _CLIENT_LOCK:
+        client = _clients.get(key)  # another worker may have built it while we waited
+        if client is None:
+            client = bedrock_session(profile, region).client("bedrock-runtime", region_name=region, config=config)
+            _clients[key] = client
+        return client
+
+
+def invalidate_runtime_client(client, profile: str | None, region: str, max_pool_connections: int = 10):
+    """
+    Evicts the cached client for this key so the next bedrock_client() call rebuilds it.
+    Used when a pooled connection has gone stale (e.g. idle NAT timeout).
+    Only evicts if `client` is still the cached one, so when many workers fail
+    together the client is rebuilt once; other keys and the session are kept.
+    """
+    key = (profile, region, max_pool_connections)
+    with _CLIENT_LOCK:
+        if _clients.get(key) is client:
+            del _clients[key]
 
 
 def to_sentence_count(text: str) -> int:
-    # naive sentence count: ., !, ?
-    return len(re.findall(r"[.!?]+(\s|$)", text))
+    # translate falls off its fast path on non-ASCII text (’, —), where the regex wins
+    if text.isascii():
+        return (text.translate(_SENTENCE_FOLD) + " ").count(". ")
+    return len(_SENTENCE_RE.findall(text))
 
 
 def brief(text: str, max_sentences: int = 2) -> bool:
@@ -82,20 +184,32 @@ def no_unexpected_handoff(text: str) -> bool:
     return "HANDOFF_READY" not in text
 
 
-def basic_traits_check(text: str, expect_traits: list[str] | None = None) -> dict:
+def basic_traits_check(text: str, expect_traits: list[str] | None = None) -> tuple[dict, str]:
+    """
+    Returns (checks, checks_json). The JSON for the four fixed checks is
+    formatted directly; orjson is only needed when extra traits are present.
+    """
+    is_brief = brief(text)
+    few_questions = no_question_stacking(text)
+    no_handoff = no_unexpected_handoff(text)
+    short = len(text) <= 500
     checks = {
-        "brief": brief(text),
-        "no_question_stacking": no_question_stacking(text),
-        "no_unexpected_handoff": no_unexpected_handoff(text),
-        "under_500_chars": len(text) <= 500,
+        "brief": is_brief,
+        "no_question_stacking": few_questions,
+        "no_unexpected_handoff": no_handoff,
+        "under_500_chars": short,
     }
-    # Optionally annotate trait expectations (heuristic)
+    # Optionally annotate trait expectations (heuristic);
+    # soft-true placeholder for clinician-scored traits
     if expect_traits:
         for trait in expect_traits:
-            if trait not in checks:
-                # soft-true placeholder for clinician-scored traits
-                checks[trait] = True
-    return checks
+            checks.setdefault(trait, True)
+        if len(checks) > 4:
+            # YAML traits can be non-string scalars (1, yes); stringify keys like json.dumps did
+            return checks, orjson.dumps(checks, option=orjson.OPT_NON_STR_KEYS).decode()
+    b = _JSON_BOOL
+    return checks, (f'{{"brief":{b[is_brief]},"no_question_stacking":{b[few_questions]},'
+                    f'"no_unexpected_handoff":{b[no_handoff]},"under_500_chars":{b[short]}}}')
 
 
 def load_manifest_active_versions(env: str) -> dict | None:
@@ -133,7 +247,18 @@ def load_cases(cases_path: Path):
          input: "text"
          expect_traits: [brief]
     Returns: list of dicts with keys: id (auto if missing), domain, input, expect_traits
+
+    The normalized list is cached next to the YAML as `<filename>.normalized.json`
+    (e.g. cases.yaml.normalized.json, so cases.yml gets its own file)
+    and reused until the YAML is modified again.
     """
+    cache_path = cases_path.with_name(cases_path.name + ".normalized.json")
+    try:
+        if cache_path.stat().st_mtime >= cases_path.stat().st_mtime:
+            return orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass  # missing or unreadable sidecar; fall back to the YAML
+
     raw = load_yaml(cases_path)
     normalized = []
     if isinstance(raw, dict):
@@ -155,14 +280,24 @@ def load_cases(cases_path: Path):
             })
     else:
         raise ValueError("Unsupported cases.yaml format.")
+
+    # Best-effort: write to a temp file and rename so readers never see a partial file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(orjson.dumps(normalized))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):
+        # read-only checkout, or YAML values orjson can't encode; re-parse next time
+        tmp_path.unlink(missing_ok=True)
     return normalized
 
 
-def anthropic_chat(client, model_id: str, system: str, user_text: str,
-                   max_tokens: int = 220, temperature: float = 0.2,
-                   retries: int = 2, retry_delay: float = 1.5) -> str:
+@lru_cache(maxsize=64)
+def payload_template(system: str, max_tokens: int, temperature: float) -> tuple[bytes, bytes]:
     """
-    Calls Anthropic Messages API on Bedrock. Returns text content.
+    Encodes the request envelope once per (system, max_tokens, temperature) and
+    splits it around the user text, which is the only per-case field.
+    Returns (prefix, suffix); the JSON-encoded user text goes in between.
     """
     body = {
         "anthropic_version": ANTHROPIC_VERSION,
@@ -172,31 +307,49 @@ def anthropic_chat(client, model_id: str, system: str, user_text: str,
         "messages": [
             {"role": "user",
              "content": [
-                 {"type": "text", "text": user_text}
+                 {"type": "text", "text": _USER_TEXT_SLOT}
              ]}
         ],
     }
-    payload = json.dumps(body).encode("utf-8")
-    last_err = None
-    for attempt in range(retries + 1):
-        try:
-            resp = client.invoke_model(
-                modelId=model_id,
-                accept="application/json",
-                contentType="application/json",
-                body=payload,
-            )
-            data = json.loads(resp["body"].read())
-            parts = data.get("content", [])
-            text = "".join(p.get("text", "") for p in parts if p.get("type") == "text").strip()
-            return text
-        except (BotoCoreError, ClientError, KeyError, json.JSONDecodeError) as e:
-            last_err = e
-            if attempt < retries:
-                time.sleep(retry_delay * (attempt + 1))
-            else:
-                raise
-    raise last_err
+    # rpartition: the slot is the last string in the body, and any occurrence
+    # inside `system` is escaped as \"...\" so it cannot match the quoted slot
+    prefix, _, suffix = orjson.dumps(body).rpartition(orjson.dumps(_USER_TEXT_SLOT))
+    return prefix, suffix
+
+
+def anthropic_chat(profile: str | None, region: str, model_id: str, system: str, user_text: str,
+                   max_tokens: int = 220, temperature: float = 0.2,
+                   max_pool_connections: int = 10) -> str:
+    """
+    Calls Anthropic Messages API on Bedrock. Returns text content.
+    Retries are left to botocore; if they are exhausted on a stale pooled
+    connection, the cached client is rebuilt and the call is made once more.
+    """
+    prefix, suffix = payload_template(system, max_tokens, temperature)
+    payload = prefix + orjson.dumps(user_text) + suffix
+
+    def invoke(client):
+        return client.invoke_model(
+            modelId=model_id,
+            accept="application/json",
+            contentType="application/json",
+            body=payload,
+        )
+
+    client = bedrock_client(profile, region, max_pool_connections)
+    try:
+        resp = invoke(client)
+    except (ConnectionClosedError, ReadTimeoutError):
+        invalidate_runtime_client(client, profile, region, max_pool_connections)
+        resp = invoke(bedrock_client(profile, region, max_pool_connections))
+
+    # orjson parses the raw body bytes as-is (no decode, no str copy). Closing the
+    # stream hands its connection back to the pool even if the read fails midway.
+    with closing(resp["body"]) as body:
+        data = orjson.loads(body.read())
+    parts = data.get("content", [])
+    text = "".join(p.get("text", "") for p in parts if p.get("type") == "text").strip()
+    return text
 
 
 def make_system_prompt(global_rules: str, agent_core: str, domain: str) -> str:
@@ -204,35 +357,260 @@ def make_system_prompt(global_rules: str, agent_core: str, domain: str) -> str:
     return f"{global_rules}\n\nAGENT DOMAIN: {domain.upper()}\n\n{agent_core}"
 
 
-def save_csv(rows: list[dict], path: Path):
-    fields = ["timestamp", "env", "model_id", "domain", "prompt_file", "case_id", "input", "output", "checks"]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+def resolve_domains(domains: list[str], active_versions: dict | None,
+                    global_rules: str) -> dict[str, tuple[Path, str]]:
+    """
+    Resolves, validates and loads each domain's prompt once.
+    Returns: {domain: (prompt_path, system_prompt)}
+    """
+    resolved = {}
+    for domain in domains:
+        prompt_path = resolve_prompt_path(domain, active_versions)
+        ensure_exists(prompt_path, f"prompt file for {domain}")
 
+        agent_doc = load_yaml(prompt_path)
+        agent_core = agent_doc.get("core_instructions", "").strip()
+        if not agent_core:
+            raise ValueError(f"No `core_instructions` in {prompt_path}")
 
-def save_md(rows: list[dict], path: Path):
-    with open(path, "w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(f"### {r['case_id']} — {r['domain']}\n\n")
-            f.write(f"**Prompt file:** `{r['prompt_file']}`  \n")
-            f.write(f"**Model:** `{r['model_id']}`  \n")
-            f.write(f"**Input:** {r['input']}\n\n")
-            f.write(f"**Output:** {r['output']}\n\n")
-            f.write(f"**Checks:** `{r['checks']}`\n\n")
-            f.write("---\n\n")
+        resolved[domain] = (prompt_path, make_system_prompt(global_rules, agent_core, domain))
+    return resolved
 
 
-def save_json(rows: list[dict], path: Path):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2, ensure_ascii=False)
+class ResultsWriter:
+    """
+    Streams rows to results.csv / results.md / results.json as cases finish,
+    so rows are never buffered in memory and an interrupted run still leaves
+    readable artifacts. Use as a context manager; results.json is closed into
+    a valid JSON array on exit.
+
+    Run-level fields (timestamp, env, model, ...) are constant for every row,
+    so they are written once to run_meta.json and the results.md header
+    instead of being repeated per row.
+    """
+    CSV_FIELDS = ["domain", "prompt_file", "case_id", "input", "output", "checks"]
+    _csv_values = staticmethod(itemgetter(*CSV_FIELDS))  # row dict -> tuple in column order
+
+    def __init__(self, out_dir: Path, meta: dict):
+        self.meta = meta
+        self.meta_path = out_dir / "run_meta.json"
+        self.csv_path = out_dir / "results.csv"
+        self.md_path = out_dir / "results.md"
+        self.json_path = out_dir / "results.json"
+        self.count = 0
+
+    def __enter__(self):
+        self.meta_path.write_bytes(orjson.dumps(self.meta, option=orjson.OPT_INDENT_2))
+        with ExitStack() as stack:
+            self._csv_f = stack.enter_context(open(self.csv_path, "w", newline="", encoding="utf-8"))
+            self._md_f = stack.enter_context(open(self.md_path, "w", encoding="utf-8"))
+            self._json_f = stack.enter_context(open(self.json_path, "w", encoding="utf-8"))
+            self._files = stack.pop_all()
+        self._csv = csv.writer(self._csv_f)
+        self._csv.writerow(self.CSV_FIELDS)
+        self._json_f.write("[")
+        self._md_f.write(f"**Run:** `{self.meta['timestamp']}` | **Env:** `{self.meta['env']}`  \n")
+        self._md_f.write(f"**Model:** `{self.meta['model_id']}`\n\n---\n\n")
+        return self
+
+    def __exit__(self, *exc):
+        self._json_f.write("\n]" if self.count else "]")
+        self._files.close()
+
+    def write(self, r: dict):
+        self._csv.writerow(self._csv_values(r))
+
+        f = self._md_f
+        f.write(f"### {r['case_id']} — {r['domain']}\n\n")
+        f.write(f"**Prompt file:** `{r['prompt_file']}`  \n")
+        f.write(f"**Input:** {r['input']}\n\n")
+        f.write(f"**Output:** {r['output']}\n\n")
+        f.write(f"**Checks:** `{r['checks']}`\n\n")
+        f.write("---\n\n")
+
+        # Same layout as json.dump(rows, indent=2), one element at a time
+        self._json_f.write(",\n" if self.count else "\n")
+        self._json_f.write(textwrap.indent(orjson.dumps(r, option=orjson.OPT_INDENT_2).decode(), "  "))
+        self.count += 1
+
+        for f in (self._csv_f, self._md_f, self._json_f):
+            f.flush()
+
+
+def is_throttling(e: Exception) -> bool:
+    return isinstance(e, ClientError) and e.response.get("Error", {}).get("Code") == "ThrottlingException"
+
+
+class RateLimiter:
+    """
+    Token bucket for a requests-per-minute quota: one token is added every
+    60/rpm seconds (holding at most `burst`), and acquire() waits for one.
+    The rate adapts AIMD-style: throttled() halves it, recovered() adds back a
+    tenth of the configured rpm, never going above it.
+    Must be created inside a running event loop.
+    """
+
+    def __init__(self, rpm: float, burst: int = 1):
+        self.max_rpm = rpm
+        self.rpm = rpm
+        self._tokens = asyncio.Queue(maxsize=burst)
+        for _ in range(burst):
+            self._tokens.put_nowait(None)
+        self._loop = asyncio.get_running_loop()
+        self._handle = self._loop.call_later(self.interval, self._refill)
+
+    def _refill(self):
+        if not self._tokens.full():
+            self._tokens.put_nowait(None)
+        self._handle = self._loop.call_later(self.interval, self._refill)
+
+    async def acquire(self):
+        await self._tokens.get()
+
+    @property
+    def interval(self) -> float:
+        return 60.0 / self.rpm
+
+    def throttled(self):
+        self.rpm = max(min(1.0, self.max_rpm), self.rpm / 2)
+
+    def recovered(self):
+        self.rpm = min(self.max_rpm, self.rpm + self.max_rpm / 10)
+
+    def close(self):
+        self._handle.cancel()
+
+
+async def run_all(profile: str | None, region: str, jobs: list[tuple[dict, Path, str]], model_id: str,
+                  max_tokens: int, temperature: float, concurrency: int,
+                  on_result: Callable[[tuple[dict, Path, str], str], None],
+                  rpm: float | None = None):
+    """
+    Runs anthropic_chat for every (case, prompt_path, system_prompt) job concurrently.
+    boto3 is synchronous, so each call runs on a worker thread. A condition-variable
+    gate admits a call only while fewer than `in_flight_limit` (initially
+    `concurrency`) are running, and an optional RateLimiter caps requests per
+    minute. On ThrottlingException the job gives up its slot, backs off with
+    jitter and queues again. The rate and the in-flight limit follow AIMD: one
+    multiplicative decrease per THROTTLE_COOLDOWN window (so a single burst
+    counts once), and an additive step back up after every
+    THROTTLE_RECOVERY_SUCCESSES successful calls.
+    `on_result(job, output)` is called on the event loop in job order: finished
+    jobs wait in a reorder buffer until every earlier job is done, so artifacts
+    stream incrementally but stay diffable across runs. Failures are passed as
+    an "[ERROR] ..." output string.
+    """
+    loop = asyncio.get_running_loop()
+    gate = asyncio.Condition()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    limiter = RateLimiter(rpm) if rpm is not None else None
+    in_flight_limit = concurrency
+    active = 0
+    last_decrease = float("-inf")
+    successes = 0
+    finished: dict[int, str] = {}  # reorder buffer: job index -> output
+    next_index = 0
+
+    def emit_ready():
+        nonlocal next_index
+        while next_index in finished:
+            on_result(jobs[next_index], finished.pop(next_index))
+            next_index += 1
+
+    async def acquire_slot():
+        nonlocal active
+        async with gate:
+            await gate.wait_for(lambda: active < in_flight_limit)
+            active += 1
+
+    async def release_slot():
+        nonlocal active
+        async with gate:
+            active -= 1
+            # Wake as many waiters as there are free slots (more after a recovery step)
+            gate.notify(max(0, in_flight_limit - active))
+
+    def on_throttle():
+        nonlocal in_flight_limit, last_decrease, successes
+        successes = 0
+        now = loop.time()
+        if now - last_decrease < THROTTLE_COOLDOWN:
+            return  # this burst already lowered the limits
+        last_decrease = now
+        if limiter:
+            limiter.throttled()
+        in_flight_limit = max(1, in_flight_limit // 2)
+
+    def on_success():
+        nonlocal in_flight_limit, successes
+        successes += 1
+        if successes < THROTTLE_RECOVERY_SUCCESSES:
+            return
+        successes = 0
+        if limiter:
+            limiter.recovered()
+        in_flight_limit = min(concurrency, in_flight_limit + 1)
+
+    async def run_one(index: int, job: tuple[dict, Path, str]):
+        case, _, system_prompt = job
+        for attempt in range(THROTTLE_RETRIES + 1):
+            await acquire_slot()
+            try:
+                if limiter:
+                    await limiter.acquire()
+                output = await loop.run_in_executor(executor, partial(
+                    anthropic_chat,
+                    profile=profile,
+                    region=region,
+                    model_id=model_id,
+                    system=system_prompt,
+                    user_text=case["input"],
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    max_pool_connections=concurrency,
+                ))
+            except Exception as e:
+                output = f"[ERROR] {type(e).__name__}: {e}"
+                throttled = is_throttling(e)
+                if throttled:
+                    on_throttle()
+            else:
+                throttled = False
+                on_success()
+            finally:
+                await release_slot()
+            if not throttled or attempt == THROTTLE_RETRIES:
+                break
+            delay = min(THROTTLE_BACKOFF_CAP, THROTTLE_BACKOFF_BASE * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+        finished[index] = output
+        emit_ready()
+
+    try:
+        await asyncio.gather(*(run_one(i, job) for i, job in enumerate(jobs)))
+    finally:
+        if limiter:
+            limiter.close()
+        executor.shutdown(wait=False)
 
 
 # -----------------------------
 # Main
 # -----------------------------
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return n
+
+
+def positive_float(value: str) -> float:
+    x = float(value)
+    if not (x > 0 and math.isfinite(x)):
+        raise argparse.ArgumentTypeError(f"must be a finite number > 0, got {value}")
+    return x
+
+
 def main():
     parser = argparse.ArgumentParser(description="Prompt refinement harness for Bedrock (Anthropic).")
     parser.add_argument("--env", default="dev", choices=["dev", "staging", "prod"], help="Environment for manifest selection.")
@@ -245,6 +623,8 @@ def main():
     parser.add_argument("--profile", default=DEFAULT_PROFILE, help="AWS profile (or omit for default creds).")
     parser.add_argument("--temperature", type=float, default=0.2, help="Sampling temperature.")
     parser.add_argument("--max_tokens", type=int, default=220, help="Max tokens for generation.")
+    parser.add_argument("--concurrency", type=positive_int, default=8, help="Max in-flight Bedrock requests.")
+    parser.add_argument("--rpm", type=positive_float, default=None, help="Max Bedrock requests per minute (default: unlimited).")
     args = parser.parse_args()
 
     # Verify required files
@@ -257,62 +637,48 @@ def main():
     cases = load_cases(Path(args.cases))
     active_versions = load_manifest_active_versions(args.env)
 
-    # Bedrock client
-    client = bedrock_client(args.profile, args.region)
+    # Bedrock client (cached; warmed here so credential errors surface before the run)
+    bedrock_client(args.profile, args.region, args.concurrency)
 
     # Output dir
     out_root = Path(args.outdir)
     out_ts_dir = timestamp_dir(out_root)
 
-    rows = []
-    ts_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    run_meta = {
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "env": args.env,
+        "model_id": args.model,
+        "region": args.region,
+        "profile": args.profile,
+        "temperature": args.temperature,
+        "max_tokens": args.max_tokens,
+    }
 
     # Run
     print(f"[config] env={args.env} model={args.model} region={args.region} profile={args.profile}\n")
     print(f"Cases: {len(cases)} | Domains: {', '.join(args.domains)}")
     print(f"Saving results to: {out_ts_dir}\n")
 
-    for case in cases:
-        domain = case["domain"]
-        if domain not in args.domains:
-            continue
-
-        prompt_path = resolve_prompt_path(domain, active_versions)
-        ensure_exists(prompt_path, f"prompt file for {domain}")
-
-        agent_doc = load_yaml(prompt_path)
-        agent_core = agent_doc.get("core_instructions", "").strip()
-        if not agent_core:
-            raise ValueError(f"No `core_instructions` in {prompt_path}")
+    # Resolve and validate each domain's prompt once, before any requests go out
+    case_domains = {case["domain"] for case in cases}
+    resolved = resolve_domains([d for d in args.domains if d in case_domains], active_versions, global_rules)
+    jobs = [(case, *resolved[case["domain"]]) for case in cases if case["domain"] in resolved]
 
-        system_prompt = make_system_prompt(global_rules, agent_core, domain)
+    def on_result(job: tuple[dict, Path, str], output: str):
+        case, prompt_path, _ = job
+        domain = case["domain"]
         user_text = case["input"]
 
-        try:
-            output = anthropic_chat(
-                client=client,
-                model_id=args.model,
-                system=system_prompt,
-                user_text=user_text,
-                max_tokens=args.max_tokens,
-                temperature=args.temperature,
-            )
-        except Exception as e:
-            output = f"[ERROR] {type(e).__name__}: {e}"
-
-        checks = basic_traits_check(output, case.get("expect_traits"))
+        checks, checks_json = basic_traits_check(output, case.get("expect_traits"))
         row = {
-            "timestamp": ts_str,
-            "env": args.env,
-            "model_id": args.model,
             "domain": domain,
             "prompt_file": str(prompt_path),
             "case_id": case["id"],
             "input": user_text,
             "output": output,
-            "checks": json.dumps(checks, ensure_ascii=False),
+            "checks": checks_json,
         }
-        rows.append(row)
+        writer.write(row)
 
         # Pretty console output
         print(f"=== {domain.upper()} | {case['id']} ===")
@@ -320,16 +686,24 @@ def main():
         print(f"Bot : {output}")
         print(f"Checks: {checks}\n")
 
-    # Save artifacts
-    save_csv(rows, out_ts_dir / "results.csv")
-    save_md(rows, out_ts_dir / "results.md")
-    save_json(rows, out_ts_dir / "results.json")
-
-    print(f"Saved: {out_ts_dir/'results.csv'}")
-    print(f"Saved: {out_ts_dir/'results.md'}")
-    print(f"Saved: {out_ts_dir/'results.json'}")
+    with ResultsWriter(out_ts_dir, run_meta) as writer:
+        asyncio.run(run_all(
+            args.profile,
+            args.region,
+            jobs,
+            model_id=args.model,
+            max_tokens=args.max_tokens,
+            temperature=args.temperature,
+            concurrency=args.concurrency,
+            on_result=on_result,
+            rpm=args.rpm,
+        ))
+
+    print(f"Saved: {writer.meta_path}")
+    print(f"Saved: {writer.csv_path}")
+    print(f"Saved: {writer.md_path}")
+    print(f"Saved: {writer.json_path}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+import harness
+
+
+def throttling_error():
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "InvokeModel")
+
+
+class RunAllThrottlingTest(unittest.TestCase):
+    def test_throttle_lowers_peak_in_flight(self):
+        # More jobs than concurrency, so the rest are already queued when the throttles land
+        concurrency, n_jobs, n_throttled = 8, 40, 8
+        lock = threading.Lock()
+        state = {"calls": 0, "active": 0}
+        in_flight_after_throttles = []
+
+        def fake_chat(**kwargs):
+            with lock:
+                state["calls"] += 1
+                call = state["calls"]
+                state["active"] += 1
+                if call > n_throttled:
+                    in_flight_after_throttles.append(state["active"])
+            try:
+                time.sleep(0.02)
+                if call <= n_throttled:
+                    raise throttling_error()
+                return "ok"
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        jobs = [({"input": str(i)}, None, "system") for i in range(n_jobs)]
+        outputs = []
+        with mock.patch.object(harness, "anthropic_chat", fake_chat), \
+                mock.patch.object(harness, "THROTTLE_COOLDOWN", 0.0), \
+                mock.patch.object(harness, "THROTTLE_BACKOFF_BASE", 0.001):
+            asyncio.run(harness.run_all(
+                None, "us-west-2", jobs, model_id="m", max_tokens=10, temperature=0.0,
+                concurrency=concurrency, on_result=lambda job, output: outputs.append(output),
+            ))
+
+        self.assertEqual(outputs, ["ok"] * n_jobs)
+        # With no cooldown every throttle halves the limit: 8 -> 1. Recovery then adds
+        # one slot per THROTTLE_RECOVERY_SUCCESSES calls, so the next calls run alone.
+        first = in_flight_after_throttles[:harness.THROTTLE_RECOVERY_SUCCESSES]
+        self.assertEqual(max(first), 1)
+        self.assertLess(max(in_flight_after_throttles), concurrency)
+
+
+if __name__ == "__main__":
+    unittest.main()